@@ -0,0 +1,175 @@
+import logging
+import random
+
+from library.diversity import is_binary, mean_hamming_distance, unique_count
+from library.population import Population
+from library.selection import Selection
+from library.operator import Crossover, Mutation
+
+
+logger = logging.getLogger(__name__)
+
+
+class Adaptation:
+    def __init__(self,
+                 generation: int,
+                 unique: int,
+                 hamming: float | None,
+                 diversity: float,
+                 action: str,
+                 mutation_rate: float | None,
+                 crossover_probability: float | None,
+                 c: float):
+        self.generation = generation
+        self.unique = unique
+        self.hamming = hamming
+        self.diversity = diversity
+        self.action = action
+        self.mutation_rate = mutation_rate
+        self.crossover_probability = crossover_probability
+        self.c = c
+
+    def __repr__(self):
+        hamming = "-" if self.hamming is None else f"{self.hamming:.3f}"
+        return (f"generation {self.generation}: {self.action} "
+                f"(unique={self.unique}, hamming={hamming}, diversity={self.diversity:.3f}) -> "
+                f"mutation_rate={self.mutation_rate}, crossover_probability={self.crossover_probability}, c={self.c}")
+
+
+class AdaptiveControl:
+    def __init__(self,
+                 low: float = 0.05,
+                 high: float = 0.25,
+                 factor: float = 1.5,
+                 mutation_bounds: tuple[float, float] = (0.00001, 0.01),
+                 crossover_bounds: tuple[float, float] = (0.6, 1.),
+                 c_bounds: tuple[float, float] = (0.95, 0.999),
+                 patience: int = 50,
+                 progress_patience: int = 200,
+                 seed: int | None = None):
+        if low >= high:
+            raise ValueError(
+                f"low should be less than high, recieved: {low} >= {high}")
+        self.low = low
+        self.high = high
+        self.factor = factor
+        self.mutation_bounds = mutation_bounds
+        self.crossover_bounds = crossover_bounds
+        self.c_bounds = c_bounds
+        self.patience = patience
+        self.progress_patience = progress_patience
+        self.seed = seed
+        self.sampler: random.Random | None = None
+        self.stall = 0
+        self.idle = 0
+        self.best_mean_health: float | None = None
+        self.fitness_function = None
+        self.decisions: list[Adaptation] = []
+        self.c: float | None = None
+        self.crossover_probability: float | None = None
+        self.mutation_rate: float | None = None
+        self.initial_mutation_rate: float | None = None
+        self.mutation_ceiling: float | None = None
+
+    def attach(self,
+               population: Population,
+               selection: Selection,
+               crossover: Crossover | None,
+               mutation: Mutation | None):
+        # The adapted values live on the controller and are passed to the operators per generation,
+        # so operators shared between settings or concurrent runs are never written to
+        individuals = population.individuals
+        self.fitness_function = selection.rank.fitness_function
+        self.c = selection.rank.c
+        self.crossover_probability = None if crossover is None else crossover.probability
+        self.mutation_rate = None if mutation is None else mutation.rate_for(
+            len(individuals[0].genotype.chromosome), len(individuals))
+        self.initial_mutation_rate = self.mutation_rate
+        # Runs with mutation stop once the population is homogeneous, which needs generations without
+        # a single mutant, so the rate is capped at one expected mutated gene per generation
+        if self.mutation_rate is not None:
+            reachable = 1 / (len(individuals[0].genotype.chromosome) * len(individuals))
+            self.mutation_ceiling = max(min(self.mutation_bounds[1], reachable), self.mutation_rate)
+        # Large populations sample their hamming distance, seeded per run so adaptive runs replay exactly
+        self.sampler = None if self.seed is None else random.Random(self.seed)
+        self.stall = 0
+        self.idle = 0
+        self.best_mean_health = None
+        self.decisions = []
+
+    @property
+    def stalled(self):
+        return self.stall >= self.patience or self.idle >= self.progress_patience
+
+    def detach(self, generation: int):
+        logger.info(f"Adaptive control stopped after {generation} generations "
+                    f"with {sum(decision.action != 'keep' for decision in self.decisions)} adaptations")
+
+    def measure(self, population: Population):
+        individuals = population.individuals
+        unique = unique_count(individuals)
+        if is_binary(individuals):
+            hamming = mean_hamming_distance(individuals, sampler=self.sampler)
+            diversity = hamming / len(individuals[0].genotype.chromosome)
+        else:
+            hamming = None
+            diversity = unique / len(individuals)
+        return unique, hamming, diversity
+
+    def adapt(self, generation: int, population: Population) -> Adaptation:
+        if self.c is None:
+            raise ValueError("AdaptiveControl.attach should be called before adapt")
+
+        unique, hamming, diversity = self.measure(population)
+
+        # Generations in a row spent exploring without lifting diversity above low
+        self.stall = self.stall + 1 if diversity < self.low else 0
+        # Generations since the mean health last reached a new best, which also ends runs that settle
+        # inside the keep band or between the thresholds without ever converging
+        individuals_health = [self.fitness_function.score(individual) for individual in population.individuals]
+        mean_health = sum(individuals_health) / len(individuals_health)
+        if self.best_mean_health is None or mean_health > self.best_mean_health:
+            self.best_mean_health = mean_health
+            self.idle = 0
+        else:
+            self.idle += 1
+
+        if diversity < self.low:
+            action, scale = "explore", self.factor
+        elif diversity > self.high:
+            action, scale = "exploit", 1 / self.factor
+        else:
+            action, scale = "keep", 1.
+
+        if action != "keep":
+            # Higher c flattens the exponential rank probabilities, so exploring lowers selection pressure
+            self.c = self._clamp(1 - (1 - self.c) / scale, self.c_bounds)
+            if self.crossover_probability is not None:
+                self.crossover_probability = self._clamp(
+                    self.crossover_probability * scale, self.crossover_bounds)
+            if self.mutation_rate is not None:
+                self.mutation_rate = self._clamp(self.mutation_rate * scale,
+                                                 (self.mutation_bounds[0], self.mutation_ceiling))
+        elif self.mutation_rate is not None and self.mutation_rate > self.initial_mutation_rate:
+            # Once diversity has recovered the extra mutation is relaxed back towards the baseline
+            action = "relax"
+            self.mutation_rate = max(self.mutation_rate / self.factor, self.initial_mutation_rate)
+
+        decision = Adaptation(generation,
+                              unique,
+                              hamming,
+                              diversity,
+                              action,
+                              self.mutation_rate,
+                              self.crossover_probability,
+                              self.c)
+        self.decisions.append(decision)
+        if action != "keep":
+            logger.info(decision)
+        else:
+            logger.debug(decision)
+        return decision
+
+    def _clamp(self, value: float, bounds: tuple[float, float]):
+        lower, upper = bounds
+        return min(max(value, lower), upper)
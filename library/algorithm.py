@@ -0,0 +1,98 @@
+from typing import Callable
+
+from library.adaptive import AdaptiveControl
+from library.population import Population
+from library.selection import Selection
+from library.operator import Crossover, Mutation
+
+
+class GeneticAlgorithm:
+    def __init__(self,
+                 population: Population,
+                 selection: Selection,
+                 crossover: Crossover or None,
+                 mutation: Mutation or None,
+                 control: AdaptiveControl | None = None,
+                 patience: int | None = None):
+        self.population = population
+        self.selection = selection
+        self.crossover = crossover
+        self.mutation = mutation
+        self.control = control
+        self.patience = patience
+        self.generations = 0
+        self.stop_reason: str | None = None
+
+    def solve(self,
+              verbose: bool = False,
+              on_generation: Callable[[int, Population], None] | None = None,
+              keep_snapshots: bool = True):
+        snapshots: list[Population] = []
+        generation = 1
+        self._best_mean_health = None
+        self._idle = 0
+        if self.control is not None:
+            self.control.attach(self.population, self.selection, self.crossover, self.mutation)
+        try:
+            while (stop_reason := self._stop_criteria(generation)) is None:
+                if keep_snapshots:
+                    snapshots.append(self.population.copy())
+                if self.control is not None:
+                    self.control.adapt(generation, self.population)
+                    self.population.evolve(selection=self.selection,
+                                           crossover=self.crossover,
+                                           mutation=self.mutation,
+                                           c=self.control.c,
+                                           crossover_probability=self.control.crossover_probability,
+                                           mutation_rate=self.control.mutation_rate)
+                else:
+                    self.population.evolve(selection=self.selection,
+                                           crossover=self.crossover,
+                                           mutation=self.mutation)
+                if self.patience is not None:
+                    self._track_progress()
+                if on_generation is not None:
+                    on_generation(generation, self.population)
+                if verbose:
+                    if generation % 25 == 0:
+                        print(f"Generation {generation} has grown!")
+                generation += 1
+        finally:
+            if self.control is not None:
+                self.control.detach(generation)
+        self.generations = generation - 1
+        self.stop_reason = stop_reason
+        return self._check_for_solution(), snapshots + [self.population.copy()]
+
+    def _track_progress(self):
+        # Counts generations since the mean health last reached a new best, so runs that can no longer
+        # converge onto identical genotypes (e.g. real-coded crossover under flat fitness) still stop
+        fitness_function = self.selection.rank.fitness_function
+        individuals_health = [fitness_function.score(individual) for individual in self.population.individuals]
+        mean_health = sum(individuals_health) / len(individuals_health)
+        if self._best_mean_health is None or mean_health > self._best_mean_health:
+            self._best_mean_health = mean_health
+            self._idle = 0
+        else:
+            self._idle += 1
+
+    def _check_for_solution(self):
+        if self.mutation is not None:
+            return self.population.is_optimal(percentage=90)
+        else:
+            return self.population.is_optimal(percentage=100)
+
+    def _stop_criteria(self, generation: int):
+        if generation == 10000001:
+            return "limit"
+        if self.control is not None and self.control.stalled:
+            return "stalled"
+        if self.patience is not None and self._idle >= self.patience:
+            return "stalled"
+        if self.mutation is not None:
+            if self.population.is_homogeneous(percentage=99):
+                return "homogeneous"
+        else:
+            if self.population.is_identical():
+                return "identical"
+        return None
@@ -0,0 +1,25 @@
+def pack(chromosome: str) -> int:
+    return int(chromosome, 2)
+
+
+def hamming(packed1: int, packed2: int) -> int:
+    return (packed1 ^ packed2).bit_count()
+
+
+def zeros(packed: int, length: int) -> int:
+    return length - packed.bit_count()
+
+
+def locus_counts(packed: list[int], length: int) -> list[int]:
+    # Bit-sliced counters: planes[k] holds bit k of every locus count, so each chromosome
+    # is added to all loci at once with a ripple carry instead of a loop over its genes
+    planes: list[int] = []
+    for carry in packed:
+        k = 0
+        while carry:
+            if k == len(planes):
+                planes.append(0)
+            planes[k], carry = planes[k] ^ carry, planes[k] & carry
+            k += 1
+    return [sum(((plane >> (length - 1 - locus)) & 1) << k for k, plane in enumerate(planes))
+            for locus in range(length)]
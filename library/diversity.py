@@ -0,0 +1,69 @@
+import random
+
+from library.bits import hamming, locus_counts, pack
+from library.individual import Individual
+from library.population import Population
+
+
+def pack_population(individuals: list[Individual]) -> list[int]:
+    return [pack(individual.genotype.chromosome) for individual in individuals]
+
+
+def is_binary(individuals: list[Individual]) -> bool:
+    return isinstance(individuals[0].genotype.chromosome, str)
+
+
+def unique_count(individuals: list[Individual]) -> int:
+    return len(set(individual.genotype.key for individual in individuals))
+
+
+def mean_hamming_distance(individuals: list[Individual],
+                          exact_limit: int = 2000,
+                          samples: int = 2000,
+                          sampler: random.Random | None = None) -> float:
+    packed = pack_population(individuals)
+    size = len(packed)
+    if size < 2:
+        return 0.
+    if size <= exact_limit:
+        # Every locus with c ones differs in c * (N - c) pairs, so the exact mean comes from bit-sliced locus counts
+        counts = locus_counts(packed, len(individuals[0].genotype.chromosome))
+        return sum(count * (size - count) for count in counts) / (size * (size - 1) // 2)
+    # Past the limit a fixed number of random distinct pairs is cheaper; drawn from a separate generator
+    # so measuring diversity never shifts the random stream of the algorithm itself, and seeded so
+    # the same population always measures the same unless the caller brings its own generator
+    if sampler is None:
+        sampler = random.Random(0)
+    distance = 0
+    for _ in range(samples):
+        index1 = sampler.randrange(size)
+        index2 = sampler.randrange(size - 1)
+        if index2 >= index1:
+            index2 += 1
+        distance += hamming(packed[index1], packed[index2])
+    return distance / samples
+
+
+def distances_to(individuals: list[Individual], target: Individual) -> list[int]:
+    packed_target = pack(target.genotype.chromosome)
+    return [hamming(packed, packed_target) for packed in pack_population(individuals)]
+
+
+def allele_frequencies(individuals: list[Individual]) -> list[float]:
+    length = len(individuals[0].genotype.chromosome)
+    counts = locus_counts(pack_population(individuals), length)
+    return [count / len(individuals) for count in counts]
+
+
+def metrics(population: Population,
+            exact_limit: int = 2000,
+            samples: int = 2000,
+            sampler: random.Random | None = None) -> dict:
+    individuals = population.individuals
+    distances = distances_to(individuals, population.optimal)
+    return {
+        "Unique": unique_count(individuals),
+        "Mean hamming": mean_hamming_distance(individuals, exact_limit, samples, sampler),
+        "Mean distance to optimum": sum(distances) / len(distances),
+        "Min distance to optimum": min(distances)
+    }
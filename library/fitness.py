@@ -4,6 +4,13 @@ import math
 from library.individual import Individual
 
 
+def coordinates(value) -> tuple:
+    # Numerical phenotypes hold a single float, real-coded ones hold a vector of floats
+    if isinstance(value, (int, float)):
+        return (value,)
+    return value
+
+
 class FitnessFunction(abc.ABC):
     @abc.abstractmethod
     def score(self, individual: Individual) -> float:
@@ -27,15 +34,13 @@ class FHDFitnessFunction(FitnessFunction):
 @FitnessFunction.register
 class QuadraticFitnessFunction(FitnessFunction):
     def score(self, individual: Individual):
-        x = individual.phenotype.value
-        return math.pow(x, 2)
+        return sum(x * x for x in coordinates(individual.phenotype.value))
 
 
 @FitnessFunction.register
 class ConstantMinusQuadraticFitnessFunction(FitnessFunction):
     def score(self, individual: Individual):
-        x = individual.phenotype.value
-        return math.pow(5.12, 2) - math.pow(x, 2)
+        return sum(math.pow(5.12, 2) - x * x for x in coordinates(individual.phenotype.value))
 
 
 @FitnessFunction.register
@@ -51,8 +56,7 @@ class CExponentialFitnessFunction(FitnessFunction):
         self.c = c
 
     def score(self, individual: Individual):
-        x = individual.phenotype.value
-        return math.exp(self.c * x)
+        return sum(math.exp(self.c * x) for x in coordinates(individual.phenotype.value))
 
 
 @CExponentialFitnessFunction.register
@@ -1,6 +1,8 @@
 import abc
 import random
 
+from array import array
+
 from library.codec import Codec, BinaryCodec
 
 
@@ -16,10 +18,35 @@ class Genotype:
     def copy(self):
         return Genotype(chromosome=self.chromosome)
 
+    @property
+    def key(self):
+        return self.chromosome
+
     def __repr__(self):
         return f"({self.chromosome})"
 
 
+class RealGenotype(Genotype):
+    def __init__(self, chromosome: array, precision: float = 0.01):
+        super().__init__(chromosome)
+        self.precision = precision
+
+    def mutate(self, locus: int, delta: float):
+        self.chromosome[locus] += delta
+
+    def copy(self):
+        return RealGenotype(chromosome=array("d", self.chromosome),
+                            precision=self.precision)
+
+    @property
+    def key(self):
+        # Genes are compared on a grid of the given precision, so converged floats count as identical
+        return tuple(round(gene / self.precision) for gene in self.chromosome)
+
+    def __repr__(self):
+        return f"({', '.join(f'{gene:.4f}' for gene in self.chromosome)})"
+
+
 class GenotypeFactory(abc.ABC):
     def __init__(self, length, codec: Codec = BinaryCodec()):
         self.length = length
@@ -82,6 +109,37 @@ class NumericalGenotypeFactory(GenotypeFactory):
         return Genotype(chromosome)
 
 
+@GenotypeFactory.register
+class RealGenotypeFactory(GenotypeFactory):
+    def __init__(self,
+                 dimensions=1,
+                 lower: float = 0.,
+                 upper: float = 10.23,
+                 precision: float = 0.01):
+        if lower >= upper:
+            raise ValueError(
+                f"lower should be less than upper, recieved: {lower} >= {upper}")
+        super().__init__(dimensions)
+        self.lower = lower
+        self.upper = upper
+        self.precision = precision
+
+    def sample(self, chromosome, encoded=True):
+        lower, upper = self.lower, self.upper
+        genes = array("d", [min(max(gene, lower), upper)
+                      for gene in chromosome])
+        return RealGenotype(genes, self.precision)
+
+    def random(self):
+        genes = array("d", [random.uniform(self.lower, self.upper)
+                      for _ in range(self.length)])
+        return RealGenotype(genes, self.precision)
+
+    def optimal(self):
+        genes = array("d", [self.upper]) * self.length
+        return RealGenotype(genes, self.precision)
+
+
 class Phenotype:
     def __init__(self, value):
         self.value = value
@@ -118,13 +176,23 @@ class NumericalPhenotypeFactory(PhenotypeFactory):
         return Phenotype(value)
 
 
+class RealPhenotypeFactory(PhenotypeFactory):
+    def sample(self, genotype: Genotype):
+        return Phenotype(value=genotype.chromosome)
+
+
 class Individual:
     def __init__(self, genotype: Genotype, phenotype: Phenotype):
         self.genotype = genotype
         self.phenotype = phenotype
 
     def copy(self):
-        return Individual(genotype=self.genotype.copy(),
+        genotype = self.genotype.copy()
+        # Real-coded phenotypes are the genotype's own array, so the copy has to point at the copied array
+        if self.phenotype.value is self.genotype.chromosome:
+            return Individual(genotype=genotype,
+                              phenotype=Phenotype(value=genotype.chromosome))
+        return Individual(genotype=genotype,
                           phenotype=self.phenotype.copy())
 
     def __repr__(self):
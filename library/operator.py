@@ -5,19 +5,17 @@ from library.individual import Individual, IndividualFactory
 
 
 class Crossover(abc.ABC):
-    def __init__(self, individual_factory: IndividualFactory) -> None:
+    def __init__(self, individual_factory: IndividualFactory, probability: float = 1.) -> None:
         self.individual_factory = individual_factory
+        self.probability = probability
 
     @abc.abstractmethod
-    def next_generation(self, individuals: list[Individual]) -> list[Individual]:
+    def next_generation(self,
+                        individuals: list[Individual],
+                        probability: float | None = None) -> list[Individual]:
         pass
 
-
-@Crossover.register
-class OnePointCrossover(Crossover):
-    def next_generation(self, prev_individuals: list[Individual]):
-        next_individuals = []
-
+    def _pairs(self, prev_individuals: list[Individual]):
         individuals = prev_individuals.copy()
 
         def pop_individual():
@@ -25,8 +23,22 @@ class OnePointCrossover(Crossover):
             return individuals.pop(index)
 
         while len(individuals) > 0:
-            parent1 = pop_individual()
-            parent2 = pop_individual()
+            yield pop_individual(), pop_individual()
+
+    def _fires(self, probability: float | None):
+        probability = self.probability if probability is None else probability
+        return probability >= 1. or random.random() < probability
+
+
+@Crossover.register
+class OnePointCrossover(Crossover):
+    def next_generation(self, prev_individuals: list[Individual], probability: float | None = None):
+        next_individuals = []
+
+        for parent1, parent2 in self._pairs(prev_individuals):
+            if not self._fires(probability):
+                next_individuals += [parent1.copy(), parent2.copy()]
+                continue
 
             chromosome1 = parent1.genotype.chromosome
             chromosome2 = parent2.genotype.chromosome
@@ -46,6 +58,82 @@ class OnePointCrossover(Crossover):
         return next_individuals
 
 
+@Crossover.register
+class BlendCrossover(Crossover):
+    def __init__(self,
+                 individual_factory: IndividualFactory,
+                 alpha: float = 0.5,
+                 probability: float = 1.) -> None:
+        super().__init__(individual_factory, probability)
+        self.alpha = alpha
+
+    def next_generation(self, prev_individuals: list[Individual], probability: float | None = None):
+        next_individuals = []
+
+        for parent1, parent2 in self._pairs(prev_individuals):
+            if not self._fires(probability):
+                next_individuals += [parent1.copy(), parent2.copy()]
+                continue
+
+            chromosome1 = parent1.genotype.chromosome
+            chromosome2 = parent2.genotype.chromosome
+
+            lows = [min(gene1, gene2) for gene1, gene2 in zip(chromosome1, chromosome2)]
+            spans = [abs(gene1 - gene2) for gene1, gene2 in zip(chromosome1, chromosome2)]
+
+            def blend():
+                return [low - self.alpha * span + random.random() * (1 + 2 * self.alpha) * span
+                        for low, span in zip(lows, spans)]
+
+            next_individuals.append(self.individual_factory.sample(blend()))
+            next_individuals.append(self.individual_factory.sample(blend()))
+
+        assert(len(prev_individuals) == len(next_individuals))
+
+        return next_individuals
+
+
+@Crossover.register
+class SBXCrossover(Crossover):
+    def __init__(self,
+                 individual_factory: IndividualFactory,
+                 eta: float = 2.,
+                 probability: float = 1.) -> None:
+        super().__init__(individual_factory, probability)
+        self.eta = eta
+
+    def next_generation(self, prev_individuals: list[Individual], probability: float | None = None):
+        next_individuals = []
+
+        for parent1, parent2 in self._pairs(prev_individuals):
+            if not self._fires(probability):
+                next_individuals += [parent1.copy(), parent2.copy()]
+                continue
+
+            chromosome1 = parent1.genotype.chromosome
+            chromosome2 = parent2.genotype.chromosome
+
+            betas = [self._spread() for _ in range(len(chromosome1))]
+
+            child1 = [0.5 * ((1 + beta) * gene1 + (1 - beta) * gene2)
+                      for beta, gene1, gene2 in zip(betas, chromosome1, chromosome2)]
+            child2 = [0.5 * ((1 - beta) * gene1 + (1 + beta) * gene2)
+                      for beta, gene1, gene2 in zip(betas, chromosome1, chromosome2)]
+
+            next_individuals.append(self.individual_factory.sample(child1))
+            next_individuals.append(self.individual_factory.sample(child2))
+
+        assert(len(prev_individuals) == len(next_individuals))
+
+        return next_individuals
+
+    def _spread(self):
+        u = random.random()
+        if u <= 0.5:
+            return pow(2 * u, 1 / (self.eta + 1))
+        return pow(1 / (2 * (1 - u)), 1 / (self.eta + 1))
+
+
 class MutationTable:
     def __init__(self):
         f = [0.0005, 0.00001]
@@ -68,23 +156,27 @@ class MutationTable:
 
 
 class Mutation(abc.ABC):
-    def __init__(self):
+    def __init__(self, rate: float | None = None):
         self.mutation_table = MutationTable()
+        self.rate = rate
+
+    def rate_for(self, l: int, n: int) -> float:
+        return self.rate if self.rate is not None else self.mutation_table.rate(l, n)
 
     @abc.abstractmethod
-    def next_generation(self, individuals: list[Individual]) -> list[Individual]:
+    def next_generation(self, individuals: list[Individual], rate: float | None = None) -> list[Individual]:
         pass
 
 
 @Mutation.register
 class DenseMutation(Mutation):
-    def next_generation(self, prev_individuals: list[Individual]):
+    def next_generation(self, prev_individuals: list[Individual], rate: float | None = None):
         next_individuals = prev_individuals.copy()
 
         n = len(next_individuals)
         l = len(next_individuals[0].genotype.chromosome)
 
-        mutation_rate = self.mutation_table.rate(l, n)
+        mutation_rate = self.rate_for(l, n) if rate is None else rate
 
         for individual in next_individuals:
             for locus, _ in enumerate(individual.genotype.chromosome):
@@ -95,3 +187,32 @@ class DenseMutation(Mutation):
         assert(len(prev_individuals) == len(next_individuals))
 
         return next_individuals
+
+
+@Mutation.register
+class GaussianMutation(Mutation):
+    def __init__(self,
+                 individual_factory: IndividualFactory,
+                 rate: float = 0.0005,
+                 sigma: float = 0.1):
+        super().__init__(rate)
+        self.individual_factory = individual_factory
+        self.sigma = sigma
+
+    def next_generation(self, prev_individuals: list[Individual], rate: float | None = None):
+        next_individuals = []
+
+        rate = self.rate if rate is None else rate
+
+        for individual in prev_individuals:
+            chromosome = individual.genotype.chromosome
+            mutations = [random.gauss(0, self.sigma) if random.random() <= rate else 0.
+                         for _ in range(len(chromosome))]
+            if any(mutations):
+                individual = self.individual_factory.sample(
+                    [gene + delta for gene, delta in zip(chromosome, mutations)])
+            next_individuals.append(individual)
+
+        assert(len(prev_individuals) == len(next_individuals))
+
+        return next_individuals
@@ -0,0 +1,53 @@
+import os
+
+from statistics import stdev
+
+from library.population import Population
+from library.fitness import FitnessFunction
+
+
+def _pyplot():
+    # matplotlib is expensive to import, so it is only loaded once something is actually plotted
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def plot_snapshot(run: int,
+                  populations: list[Population],
+                  fitness_function: FitnessFunction,
+                  algorithm_name: str):
+    plot_data = []
+
+    N = len(populations[0].individuals)
+    generations = [number for number in range(1, len(populations) + 1)]
+
+    for population in populations:
+        individuals_health = [fitness_function.score(
+            individual) for individual in population.individuals]
+        plot_data.append({
+            "Mean health": sum(individuals_health) / len(individuals_health),
+            "Max health": max(individuals_health),
+            "Min health": min(individuals_health),
+            "Stdev health": stdev(individuals_health)
+        })
+
+    dirfig = f"function/{N}/{algorithm_name}/{run}"
+    if not os.path.exists(dirfig):
+        os.makedirs(dirfig)
+
+    plt = _pyplot()
+
+    def plot_metric(metric_name: str):
+        metric_data = list(
+            map(lambda plot_item: plot_item[metric_name], plot_data))
+        plt.title(metric_name)
+        plt.plot(generations, metric_data)
+        plt.ylabel(metric_name)
+        plt.xlabel("Generation")
+        plt.savefig(f'{dirfig}/{metric_name}')
+        plt.clf()
+
+    metrics = ["Mean health", "Max health", "Min health", "Stdev health"]
+
+    for metric in metrics:
+        plot_metric(metric)
@@ -13,30 +13,33 @@ class Population:
     def evolve(self,
                selection: Selection,
                crossover: Crossover or None,
-               mutation: Mutation or None):
+               mutation: Mutation or None,
+               c: float | None = None,
+               crossover_probability: float | None = None,
+               mutation_rate: float | None = None):
         individuals = self.individuals.copy()
-        individuals = selection.next_generation(individuals)
+        individuals = selection.next_generation(individuals, c)
         if crossover is not None:
-            individuals = crossover.next_generation(individuals)
+            individuals = crossover.next_generation(individuals, crossover_probability)
         if mutation is not None:
-            individuals = mutation.next_generation(individuals)
+            individuals = mutation.next_generation(individuals, mutation_rate)
         self.individuals = individuals
 
     def is_optimal(self, percentage: float = 90.):
         total = len(self.individuals)
-        optimal = len(list(filter(lambda individual: individual.genotype.chromosome ==
-                                  self.optimal.genotype.chromosome, self.individuals)))
+        optimal = len(list(filter(lambda individual: individual.genotype.key ==
+                                  self.optimal.genotype.key, self.individuals)))
         return (optimal / total) * 100 >= percentage
 
     def is_identical(self, count: int = 1):
         unique = len(
-            set(map(lambda individual: individual.genotype.chromosome, self.individuals)))
+            set(map(lambda individual: individual.genotype.key, self.individuals)))
         return unique == count
 
     def is_homogeneous(self, percentage: float = 99.):
         total = len(self.individuals)
         unique = len(
-            set(map(lambda individual: individual.genotype.chromosome, self.individuals)))
+            set(map(lambda individual: individual.genotype.key, self.individuals)))
         non_unique = total - unique
         return (non_unique / total) * 100 >= percentage
 
@@ -0,0 +1,226 @@
+import itertools
+import random
+import time
+
+from collections import Counter
+from statistics import stdev
+
+from library.individual import BinaryGenotypeFactory, BinaryPhenotypeFactory, IndividualFactory, NumericalGenotypeFactory, NumericalPhenotypeFactory, RealGenotypeFactory, RealPhenotypeFactory
+from library.fitness import FitnessFunction, Constant100FitnessFunction, ConstantQuadraticFitnessFunction, FHDFitnessFunction, ExponentialFitnessFunction, QuadraticFitnessFunction, ConstantMinusQuadraticFitnessFunction, QuarterExponentialFitnessFunction, TwiceExponentialFitnessFunction
+from library.population import Population
+from library.selection import Selection, RWS, SUS
+from library.operator import BlendCrossover, Crossover, DenseMutation, GaussianMutation, Mutation, OnePointCrossover, SBXCrossover
+from library.codec import BinaryCodec
+from library.store import ResultStore
+from library.adaptive import AdaptiveControl
+from library.algorithm import GeneticAlgorithm
+
+
+class GeneticAlgorithmSandbox:
+    def __init__(self,
+                 individual_factory: IndividualFactory,
+                 fitness_functions: list[FitnessFunction],
+                 crossovers: list[Crossover | None] | None = None,
+                 mutations: list[Mutation | None] | None = None,
+                 patience: int | None = None):
+        if crossovers is None:
+            crossovers = [OnePointCrossover(individual_factory), None]
+        if mutations is None:
+            mutations = [DenseMutation(), None]
+        selections: list[type[Selection]] = [RWS, SUS]
+
+        self.settings: list[dict] = [
+            {
+                "fitness_function": fitness_function,
+                "selection": selection(fitness_function),
+                "crossover": crossover,
+                "mutation": mutation
+            }
+            for (selection, fitness_function, crossover, mutation)
+            in itertools.product(*[selections, fitness_functions, crossovers, mutations])
+        ]
+        self.individual_factory = individual_factory
+        self.patience = patience
+
+    def initial_population(self, size: int = 100):
+        random_individuals = self.individual_factory.random(size - 1)
+        optimal_individuals = self.individual_factory.optimal(1)
+
+        individuals = random_individuals + optimal_individuals
+        optimal = optimal_individuals[0]
+
+        return Population(individuals, optimal)
+
+    def report(self,
+               size: int = 100,
+               runs: int = 1,
+               snapshot_first: int = 5,
+               verbose=False,
+               adaptive=False,
+               store: ResultStore | None = None,
+               seed: int | None = None):
+        statistics = Counter()
+        # Runs are only reseeded when a seed is given, which is what makes recorded runs replayable
+        seeds = random.Random(seed) if seed is not None else None
+
+        for run in range(1, runs + 1):
+            population_seed = self._reseed(seeds)
+            initial_population = self.initial_population(size)
+
+            for setting in self.settings:
+                name = self._name(setting)
+
+                if verbose:
+                    print(f"{name} is running...")
+
+                setting_seed = self._reseed(seeds)
+
+                algorithm = self._algorithm(initial_population, setting, adaptive, setting_seed)
+                started = time.perf_counter()
+                has_solution, populations = algorithm.solve(verbose, keep_snapshots=run <= snapshot_first)
+                elapsed = time.perf_counter() - started
+
+                statistics[name] += 1 if has_solution else 0
+
+                if store is not None:
+                    store.record(self._result(run,
+                                              population_seed,
+                                              setting_seed,
+                                              setting,
+                                              name,
+                                              adaptive,
+                                              algorithm,
+                                              has_solution,
+                                              elapsed))
+
+                if run <= snapshot_first:
+                    self.plot_snapshot(run,
+                                       populations,
+                                       setting["fitness_function"],
+                                       name)
+
+        if store is not None:
+            store.flush()
+
+        return statistics
+
+    def replay(self,
+               setting_name: str,
+               size: int,
+               population_seed: int,
+               seed: int,
+               adaptive: bool = False) -> GeneticAlgorithm:
+        setting = next((setting for setting in self.settings if self._name(setting) == setting_name), None)
+        if setting is None:
+            raise ValueError(f"no setting named {setting_name}")
+        random.seed(population_seed)
+        initial_population = self.initial_population(size)
+        random.seed(seed)
+        algorithm = self._algorithm(initial_population, setting, adaptive, seed)
+        algorithm.solve()
+        return algorithm
+
+    def _reseed(self, seeds: random.Random | None):
+        if seeds is None:
+            return None
+        seed = seeds.randrange(2 ** 32)
+        random.seed(seed)
+        return seed
+
+    def _name(self, setting: dict):
+        return f"<{', '.join(f'{function.__class__.__name__}' for function in setting.values())}>"
+
+    def _algorithm(self, initial_population: Population, setting: dict, adaptive: bool, seed: int | None = None):
+        _, *rest_setting = setting.values()
+        # Mutation changes genotypes in place, so every setting starts from its own copy of the individuals
+        population = Population([individual.copy() for individual in initial_population.individuals],
+                                initial_population.optimal.copy())
+        return GeneticAlgorithm(population, *rest_setting,
+                                control=AdaptiveControl(seed=seed) if adaptive else None,
+                                patience=self.patience)
+
+    def _result(self,
+                run: int,
+                population_seed: int | None,
+                seed: int | None,
+                setting: dict,
+                name: str,
+                adaptive: bool,
+                algorithm: GeneticAlgorithm,
+                has_solution: bool,
+                elapsed: float):
+        fitness_function, selection, crossover, mutation = setting.values()
+        individuals_health = [fitness_function.score(
+            individual) for individual in algorithm.population.individuals]
+        return {
+            "sandbox": self.__class__.__name__,
+            "setting": name,
+            "fitness": fitness_function.__class__.__name__,
+            "selection": selection.__class__.__name__,
+            "crossover": None if crossover is None else crossover.__class__.__name__,
+            "mutation": None if mutation is None else mutation.__class__.__name__,
+            "adaptive": int(adaptive),
+            "size": len(algorithm.population.individuals),
+            "run": run,
+            "population_seed": population_seed,
+            "seed": seed,
+            "generations": algorithm.generations,
+            "stop_reason": algorithm.stop_reason,
+            "solved": int(has_solution),
+            "elapsed": elapsed,
+            "mean_health": sum(individuals_health) / len(individuals_health),
+            "max_health": max(individuals_health),
+            "min_health": min(individuals_health),
+            "stdev_health": stdev(individuals_health)
+        }
+
+    def plot_snapshot(self,
+                      run: int,
+                      populations: list[Population],
+                      fitness_function: FitnessFunction,
+                      algorithm_name: str):
+        from library.plot import plot_snapshot
+        plot_snapshot(run, populations, fitness_function, algorithm_name)
+
+
+class BinaryGeneticAlgorithmSandbox(GeneticAlgorithmSandbox):
+    def __init__(self):
+        super().__init__(individual_factory=IndividualFactory(genotype_factory=BinaryGenotypeFactory(length=100, codec=BinaryCodec()),
+                                                              phenotype_factory=BinaryPhenotypeFactory(codec=BinaryCodec())),
+                         fitness_functions=[
+            Constant100FitnessFunction(),
+            FHDFitnessFunction()
+        ])
+
+
+class NumericalGeneticAlgorithmSandbox(GeneticAlgorithmSandbox):
+    def __init__(self):
+        super().__init__(individual_factory=IndividualFactory(genotype_factory=NumericalGenotypeFactory(length=10, codec=BinaryCodec()),
+                                                              phenotype_factory=NumericalPhenotypeFactory(codec=BinaryCodec())),
+                         fitness_functions=[
+            QuadraticFitnessFunction(),
+            ConstantMinusQuadraticFitnessFunction(),
+            ConstantQuadraticFitnessFunction(),
+            QuarterExponentialFitnessFunction(),
+            ExponentialFitnessFunction(),
+            TwiceExponentialFitnessFunction(),
+        ])
+
+
+class RealGeneticAlgorithmSandbox(GeneticAlgorithmSandbox):
+    def __init__(self, dimensions: int = 1):
+        individual_factory = IndividualFactory(genotype_factory=RealGenotypeFactory(dimensions=dimensions, lower=0., upper=10.23),
+                                               phenotype_factory=RealPhenotypeFactory())
+        super().__init__(individual_factory=individual_factory,
+                         fitness_functions=[
+                             QuadraticFitnessFunction(),
+                             ConstantMinusQuadraticFitnessFunction(),
+                             ConstantQuadraticFitnessFunction(),
+                             QuarterExponentialFitnessFunction(),
+                             ExponentialFitnessFunction(),
+                             TwiceExponentialFitnessFunction(),
+                         ],
+                         crossovers=[BlendCrossover(individual_factory),
+                                     SBXCrossover(individual_factory), None],
+                         mutations=[GaussianMutation(individual_factory), None],
+                         patience=100)
@@ -13,17 +13,17 @@ class Rank:
         self.c = c
         self.fitness_function = fitness_function
 
-    def match_with_probabilities(self, individuals: list[Individual]):
+    def match_with_probabilities(self, individuals: list[Individual], c: float | None = None):
         individuals = self._sort(individuals)
-        probabilities = self._assign_probabilities(individuals)
+        probabilities = self._assign_probabilities(individuals, self.c if c is None else c)
         return zip(individuals, probabilities)
 
-    def _assign_probabilities(self, individuals: list[Individual]):
+    def _assign_probabilities(self, individuals: list[Individual], c: float):
         size = len(individuals)
-        return [self._assign_probability(size, rank) for rank in range(1, size + 1)]
+        return [self._assign_probability(size, rank, c) for rank in range(1, size + 1)]
 
-    def _assign_probability(self, size: int, rank: int) -> float:
-        return ((self.c - 1) / (pow(self.c, size) - 1)) * pow(self.c, size - rank)
+    def _assign_probability(self, size: int, rank: int, c: float) -> float:
+        return ((c - 1) / (pow(c, size) - 1)) * pow(c, size - rank)
 
     def _sort(self, individuals: list[Individual]):
         return sorted(individuals.copy(), key=functools.cmp_to_key(self._compare))
@@ -42,7 +42,7 @@ class Selection(abc.ABC):
         self.rank = Rank(0.9801, fitness_function)
 
     @abc.abstractmethod
-    def next_generation(self, individuals: list[Individual]) -> list[Individual]:
+    def next_generation(self, individuals: list[Individual], c: float | None = None) -> list[Individual]:
         pass
 
 
@@ -51,14 +51,14 @@ class RWS(Selection):
     def __init__(self, fitness_function: FitnessFunction):
         super().__init__(fitness_function)
 
-    def next_generation(self, individuals: list[Individual]):
+    def next_generation(self, individuals: list[Individual], c: float | None = None):
         next_individuals = []
 
         wheel = dict()
         spins = len(individuals)
         segment = 0
 
-        for individual, probability in self.rank.match_with_probabilities(individuals):
+        for individual, probability in self.rank.match_with_probabilities(individuals, c):
             segment_from, segment_to = segment, segment + probability
             wheel[(segment_from, segment_to)] = individual
             segment += probability
@@ -80,13 +80,13 @@ class SUS(Selection):
     def __init__(self, fitness_function: FitnessFunction):
         super().__init__(fitness_function)
 
-    def next_generation(self, individuals: list[Individual]):
+    def next_generation(self, individuals: list[Individual], c: float | None = None):
         next_individuals = []
 
         wheel = dict()
         segment = 0
 
-        for individual, probability in self.rank.match_with_probabilities(individuals):
+        for individual, probability in self.rank.match_with_probabilities(individuals, c):
             segment_from, segment_to = segment, segment + probability
             wheel[(segment_from, segment_to)] = individual
             segment += probability
@@ -0,0 +1,359 @@
+import argparse
+import asyncio
+import collections
+import itertools
+import json
+import multiprocessing
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+
+from library.algorithm import GeneticAlgorithm
+from library.diversity import is_binary, metrics
+from library.operator import DenseMutation
+from library.population import Population
+from library.sandbox import GeneticAlgorithmSandbox, BinaryGeneticAlgorithmSandbox, NumericalGeneticAlgorithmSandbox, RealGeneticAlgorithmSandbox
+
+
+TERMINAL_EVENTS = ("done", "cancelled", "error")
+
+SANDBOXES: dict[str, type[GeneticAlgorithmSandbox]] = {
+    "binary": BinaryGeneticAlgorithmSandbox,
+    "numerical": NumericalGeneticAlgorithmSandbox,
+    "real": RealGeneticAlgorithmSandbox
+}
+
+_sandboxes: dict[str, GeneticAlgorithmSandbox] = {}
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def _warm_sandboxes():
+    # Runs once in every worker process, so each worker keeps its own sandboxes warm across jobs
+    for name, sandbox in SANDBOXES.items():
+        _sandboxes[name] = sandbox()
+
+
+def run_job(job_id: int,
+            sandbox_name: str,
+            setting_index: int,
+            size: int,
+            runs: int,
+            events,
+            cancelled):
+    def publish(event: dict):
+        events.put({"job": job_id, **event})
+
+    sandbox = _sandboxes[sandbox_name]
+    fitness_function, *rest_setting = sandbox.settings[setting_index].values()
+
+    publish({"event": "running"})
+    try:
+        for run in range(1, runs + 1):
+            def on_generation(generation: int, population: Population):
+                if cancelled.is_set():
+                    raise JobCancelled()
+                individuals_health = [fitness_function.score(
+                    individual) for individual in population.individuals]
+                event = {
+                    "event": "generation",
+                    "run": run,
+                    "generation": generation,
+                    "mean": sum(individuals_health) / len(individuals_health),
+                    "max": max(individuals_health),
+                    "min": min(individuals_health)
+                }
+                if is_binary(population.individuals):
+                    diversity = metrics(population)
+                    event.update({
+                        "unique": diversity["Unique"],
+                        "hamming": diversity["Mean hamming"],
+                        "distance": diversity["Mean distance to optimum"]
+                    })
+                publish(event)
+
+            algorithm = GeneticAlgorithm(
+                sandbox.initial_population(size), *rest_setting, patience=sandbox.patience)
+            has_solution, _ = algorithm.solve(
+                on_generation=on_generation, keep_snapshots=False)
+
+            publish({
+                "event": "run",
+                "run": run,
+                "solved": has_solution,
+                "generations": algorithm.generations
+            })
+    except JobCancelled:
+        publish({"event": "cancelled"})
+    except Exception as error:
+        publish({"event": "error", "error": repr(error)})
+    else:
+        publish({"event": "done"})
+
+
+class Job:
+    def __init__(self,
+                 id: int,
+                 sandbox_name: str,
+                 setting_index: int,
+                 size: int,
+                 runs: int,
+                 cancelled):
+        self.id = id
+        self.sandbox_name = sandbox_name
+        self.setting_index = setting_index
+        self.size = size
+        self.runs = runs
+        self.state = "queued"
+        self.events: asyncio.Queue = asyncio.Queue()
+        self.listening = True
+        self.cancelled = cancelled
+
+    def publish(self, event: dict):
+        # Events of a job whose client has gone are dropped instead of piling up in its queue
+        if self.listening or event["event"] in TERMINAL_EVENTS:
+            self.events.put_nowait({"job": self.id, **event})
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+class ExperimentServer:
+    def __init__(self, workers: int = 2, queue_size: int = 16, history_size: int = 100):
+        # Sandboxes of the server process only validate job specs, the jobs themselves run on the worker processes
+        self.sandboxes: dict[str, GeneticAlgorithmSandbox] = {
+            name: sandbox() for name, sandbox in SANDBOXES.items()
+        }
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.jobs: dict[int, Job] = {}
+        self.history: collections.deque[tuple[int, str]] = collections.deque(maxlen=history_size)
+        self._job_ids = itertools.count(1)
+        self._executor: ProcessPoolExecutor | None = None
+        self._manager = None
+        self._events = None
+        self._relay: threading.Thread | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self,
+                    host: str = "127.0.0.1",
+                    port: int = 8765,
+                    path: str | None = None):
+        context = multiprocessing.get_context("spawn")
+        self._manager = context.Manager()
+        self._events = self._manager.Queue()
+        self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=context,
+                                             initializer=_warm_sandboxes)
+        self._relay = threading.Thread(target=self._relay_events,
+                                       args=(asyncio.get_running_loop(),),
+                                       daemon=True)
+        self._relay.start()
+        self._worker_tasks = [asyncio.create_task(self._worker())
+                              for _ in range(self.workers)]
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for job in self.jobs.values():
+            job.cancel()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown, True)
+        self._events.put(None)
+        await loop.run_in_executor(None, self._relay.join)
+        self._manager.shutdown()
+
+    def submit(self, spec: dict) -> Job:
+        sandbox_name = spec.get("sandbox")
+        if sandbox_name not in self.sandboxes:
+            raise ValueError(
+                f"sandbox should be one of {list(self.sandboxes)}, recieved: {sandbox_name}")
+        sandbox = self.sandboxes[sandbox_name]
+
+        size = spec.get("size", 100)
+        runs = spec.get("runs", 1)
+        if not isinstance(size, int) or size < 2:
+            raise ValueError(f"size should be an integer >= 2, recieved: {size}")
+        if not isinstance(runs, int) or runs < 1:
+            raise ValueError(f"runs should be an integer >= 1, recieved: {runs}")
+
+        setting_index = self._setting(sandbox, spec)
+        setting = sandbox.settings[setting_index]
+        if setting["crossover"] is not None and size % 2 != 0:
+            raise ValueError(f"size should be even to pair parents for crossover, recieved: {size}")
+        mutation = setting["mutation"]
+        if isinstance(mutation, DenseMutation) and mutation.rate is None and size not in mutation.mutation_table.n:
+            raise ValueError(
+                f"size should be one of {mutation.mutation_table.n} for the mutation table, recieved: {size}")
+
+        if self.queue.full():
+            raise ValueError(f"queue is full, {self.queue.qsize()} jobs are waiting")
+
+        job = Job(next(self._job_ids),
+                  sandbox_name,
+                  setting_index,
+                  size,
+                  runs,
+                  self._manager.Event())
+        self.queue.put_nowait(job)
+        self.jobs[job.id] = job
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.state in TERMINAL_EVENTS:
+            return False
+        if job.state == "queued":
+            self._finish(job, {"event": "cancelled"})
+        else:
+            job.cancel()
+        return True
+
+    def status(self):
+        return {
+            "queued": self.queue.qsize(),
+            "jobs": {job.id: job.state for job in self.jobs.values()},
+            "finished": dict(self.history)
+        }
+
+    def _setting(self, sandbox: GeneticAlgorithmSandbox, spec: dict):
+        wanted = (spec.get("fitness"),
+                  spec.get("selection"),
+                  spec.get("crossover"),
+                  spec.get("mutation"))
+        for index, setting in enumerate(sandbox.settings):
+            names = tuple(None if function is None else function.__class__.__name__
+                          for function in setting.values())
+            if names == wanted:
+                return index
+        raise ValueError(f"no setting matches <{', '.join(map(str, wanted))}>")
+
+    def _relay_events(self, loop: asyncio.AbstractEventLoop):
+        # Worker processes report through one shared queue, which is drained on this thread and handed to the loop
+        while (event := self._events.get()) is not None:
+            loop.call_soon_threadsafe(self._dispatch, event)
+
+    def _dispatch(self, event: dict):
+        job = self.jobs.get(event["job"])
+        if job is None:
+            return
+        if event["event"] in TERMINAL_EVENTS:
+            self._finish(job, event)
+        else:
+            job.publish(event)
+
+    def _finish(self, job: Job, event: dict):
+        # Finished jobs only live on in a bounded history, their events are left to the forwarder draining them
+        job.state = event["event"]
+        job.publish(event)
+        self.jobs.pop(job.id, None)
+        self.history.append((job.id, job.state))
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job: Job = await self.queue.get()
+            try:
+                if job.state == "cancelled":
+                    continue
+                job.state = "running"
+                try:
+                    await loop.run_in_executor(self._executor,
+                                               run_job,
+                                               job.id,
+                                               job.sandbox_name,
+                                               job.setting_index,
+                                               job.size,
+                                               job.runs,
+                                               self._events,
+                                               job.cancelled)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as error:
+                    # The worker process itself failed, so no terminal event will arrive through the relay
+                    if job.state not in TERMINAL_EVENTS:
+                        self._finish(job, {"event": "error", "error": repr(error)})
+            finally:
+                self.queue.task_done()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        lock = asyncio.Lock()
+        owned: set[Job] = set()
+        forwarders: set[asyncio.Task] = set()
+
+        async def send(message: dict):
+            async with lock:
+                writer.write((json.dumps(message) + "\n").encode())
+                await writer.drain()
+
+        async def forward(job: Job):
+            while True:
+                event = await job.events.get()
+                await send(event)
+                if event["event"] in TERMINAL_EVENTS:
+                    owned.discard(job)
+                    break
+
+        try:
+            async for line in reader:
+                try:
+                    request = json.loads(line)
+                    op = request.get("op")
+                    if op == "submit":
+                        job = self.submit(request.get("job", {}))
+                        owned.add(job)
+                        await send({"event": "queued", "job": job.id})
+                        forwarder = asyncio.create_task(forward(job))
+                        forwarders.add(forwarder)
+                        forwarder.add_done_callback(forwarders.discard)
+                    elif op == "cancel":
+                        cancelled = self.cancel(request.get("job"))
+                        await send({"event": "cancelling", "job": request.get("job"), "accepted": cancelled})
+                    elif op == "status":
+                        await send({"event": "status", **self.status()})
+                    else:
+                        raise ValueError(f"op should be one of submit, cancel, status, recieved: {op}")
+                except ValueError as error:
+                    await send({"event": "error", "error": str(error)})
+        except ConnectionError:
+            pass
+        finally:
+            # Nobody is left to stream the results to, so the jobs of a closed connection are dropped
+            for job in list(owned):
+                job.listening = False
+                self.cancel(job.id)
+            for forwarder in list(forwarders):
+                forwarder.cancel()
+            writer.close()
+
+
+async def serve(host: str, port: int, path: str | None, workers: int, queue_size: int):
+    server = ExperimentServer(workers=workers, queue_size=queue_size)
+    await server.start(host=host, port=port, path=path)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve genetic algorithm experiments over a local socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default=None, help="serve on a unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.path, args.workers, args.queue_size))
@@ -0,0 +1,105 @@
+import sqlite3
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    sandbox TEXT NOT NULL,
+    setting TEXT NOT NULL,
+    fitness TEXT NOT NULL,
+    selection TEXT NOT NULL,
+    crossover TEXT,
+    mutation TEXT,
+    adaptive INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    run INTEGER NOT NULL,
+    population_seed INTEGER,
+    seed INTEGER,
+    generations INTEGER NOT NULL,
+    stop_reason TEXT,
+    solved INTEGER NOT NULL,
+    elapsed REAL NOT NULL,
+    mean_health REAL,
+    max_health REAL,
+    min_health REAL,
+    stdev_health REAL
+);
+DROP INDEX IF EXISTS experiments_setting;
+DROP INDEX IF EXISTS experiments_sandbox;
+CREATE INDEX IF NOT EXISTS experiments_summary
+    ON experiments (sandbox, setting, adaptive, size, solved, generations);
+"""
+
+SUCCESS_RATE = """
+SELECT sandbox, setting, adaptive, size, AVG(solved) FROM experiments
+WHERE (:size IS NULL OR size = :size)
+GROUP BY sandbox, setting, adaptive, size
+"""
+
+MEAN_GENERATIONS = """
+SELECT sandbox, setting, adaptive, size, AVG(generations) FROM experiments
+WHERE (:size IS NULL OR size = :size) AND (:solved_only = 0 OR solved = 1)
+GROUP BY sandbox, setting, adaptive, size
+"""
+
+COLUMNS = ("created", "sandbox", "setting", "fitness", "selection", "crossover", "mutation", "adaptive",
+           "size", "run", "population_seed", "seed", "generations", "stop_reason", "solved", "elapsed",
+           "mean_health", "max_health", "min_health", "stdev_health")
+
+
+class ResultStore:
+    def __init__(self, path: str = ":memory:", batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        if path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self._pending: list[tuple] = []
+
+    def record(self, result: dict):
+        result = {"created": time.time(), **result}
+        missing = set(COLUMNS) - set(result)
+        if missing:
+            raise ValueError(f"result is missing columns: {sorted(missing)}")
+        self._pending.append(tuple(result[column] for column in COLUMNS))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        # One transaction per batch keeps thousands of runs from paying a commit each
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO experiments ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                self._pending)
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def count(self):
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM experiments").fetchone()[0]
+
+    def success_rate(self, size: int | None = None):
+        self.flush()
+        rows = self.connection.execute(SUCCESS_RATE, {"size": size})
+        return {(sandbox, setting, bool(adaptive), N): rate for sandbox, setting, adaptive, N, rate in rows}
+
+    def mean_generations(self, size: int | None = None, solved_only: bool = True):
+        self.flush()
+        rows = self.connection.execute(MEAN_GENERATIONS, {"size": size, "solved_only": int(solved_only)})
+        return {(sandbox, setting, bool(adaptive), N): generations
+                for sandbox, setting, adaptive, N, generations in rows}
@@ -0,0 +1,137 @@
+import random
+
+import pytest
+
+from library.adaptive import AdaptiveControl
+from library.fitness import FHDFitnessFunction
+from library.individual import BinaryGenotypeFactory, BinaryPhenotypeFactory, IndividualFactory
+from library.operator import DenseMutation, OnePointCrossover
+from library.population import Population
+from library.algorithm import GeneticAlgorithm
+from library.fitness import Constant100FitnessFunction
+from library.sandbox import BinaryGeneticAlgorithmSandbox, NumericalGeneticAlgorithmSandbox
+from library.selection import SUS
+
+
+individual_factory = IndividualFactory(genotype_factory=BinaryGenotypeFactory(length=10),
+                                       phenotype_factory=BinaryPhenotypeFactory())
+
+
+def population_of(chromosomes: list[str]):
+    individuals = [individual_factory.sample(chromosome) for chromosome in chromosomes]
+    return Population(individuals, individual_factory.optimal(1)[0])
+
+
+@pytest.mark.parametrize("chromosomes,action", [
+    (["0000000000"] * 100, "explore"),
+    (["0000011111", "1111100000"] * 50, "exploit"),
+    (["0000000000"] * 90 + ["1111111111"] * 10, "keep")
+])
+def test_AdaptiveControl_adapt(chromosomes, action):
+    selection = SUS(FHDFitnessFunction())
+    crossover = OnePointCrossover(individual_factory, probability=0.8)
+    mutation = DenseMutation(rate=0.0005)
+    control = AdaptiveControl(low=0.05, high=0.25)
+
+    population = population_of(chromosomes)
+    control.attach(population, selection, crossover, mutation)
+    decision = control.adapt(1, population)
+
+    assert decision.action == action
+    assert decision.unique == len(set(chromosomes))
+    if action == "explore":
+        assert control.mutation_rate > 0.0005 and control.crossover_probability > 0.8 and control.c > 0.9801
+    elif action == "exploit":
+        assert control.mutation_rate < 0.0005 and control.crossover_probability < 0.8 and control.c < 0.9801
+    else:
+        assert (control.mutation_rate, control.crossover_probability, control.c) == (0.0005, 0.8, 0.9801)
+
+    # The shared operators themselves are never written to
+    assert (mutation.rate, crossover.probability, selection.rank.c) == (0.0005, 0.8, 0.9801)
+
+
+def test_AdaptiveControl_bounds():
+    selection = SUS(FHDFitnessFunction())
+    mutation = DenseMutation()
+    control = AdaptiveControl(mutation_bounds=(0.00001, 0.01), c_bounds=(0.95, 0.999))
+    population = population_of(["0000000000"] * 100)
+
+    control.attach(population, selection, None, mutation)
+    for generation in range(1, 50):
+        control.adapt(generation, population)
+
+    # 1 / (N * L) keeps a generation without any mutant, and so homogeneity, reachable
+    assert control.mutation_rate == pytest.approx(0.001)
+    assert control.c == 0.999
+    assert control.crossover_probability is None
+    assert len(control.decisions) == 49
+
+
+def test_AdaptiveControl_adapt_before_attach():
+    with pytest.raises(ValueError):
+        AdaptiveControl().adapt(1, population_of(["0000000000"] * 100))
+
+
+def test_AdaptiveControl_relaxes_mutation_rate():
+    selection = SUS(FHDFitnessFunction())
+    mutation = DenseMutation()
+    control = AdaptiveControl(low=0.05, high=0.25)
+
+    control.attach(population_of(["0000000000"] * 100), selection, None, mutation)
+    control.adapt(1, population_of(["0000000000"] * 100))
+    assert control.mutation_rate > control.initial_mutation_rate
+
+    decision = control.adapt(2, population_of(["0000000000"] * 90 + ["1111111111"] * 10))
+    assert decision.action == "relax"
+    assert control.mutation_rate == pytest.approx(control.initial_mutation_rate)
+
+
+def test_AdaptiveControl_stalls_without_progress():
+    # Diversity stays between low and high, so only the missing progress on a flat fitness can stop the run
+    population = population_of(["0000000000", "1111111111", "0000011111", "1111100000"] * 5)
+    control = AdaptiveControl(progress_patience=3)
+    control.attach(population, SUS(Constant100FitnessFunction()), None, None)
+
+    for generation in range(1, 4):
+        assert not control.stalled
+        assert control.adapt(generation, population).action == "exploit"
+    control.adapt(4, population)
+
+    assert control.stall == 0
+    assert control.stalled
+
+
+
+def test_AdaptiveControl_seeded_measure_is_reproducible():
+    # Past the exact limit the mean hamming distance is sampled, from a generator seeded by the run
+    population = population_of([format(index % 1024, "010b") for index in range(2500)])
+
+    def measure(seed: int):
+        control = AdaptiveControl(seed=seed)
+        control.attach(population, SUS(Constant100FitnessFunction()), None, None)
+        return control.measure(population)
+
+    random.seed(3)
+    expected = random.random()
+    random.seed(3)
+    assert measure(11) == measure(11)
+    assert random.random() == expected
+
+sandboxes = [BinaryGeneticAlgorithmSandbox(), NumericalGeneticAlgorithmSandbox()]
+
+
+@pytest.mark.parametrize("sandbox,setting", [
+    (sandbox, setting) for sandbox in sandboxes for setting in sandbox.settings
+], ids=[f"{sandbox.__class__.__name__}{sandbox._name(setting)}" for sandbox in sandboxes for setting in sandbox.settings])
+def test_GeneticAlgorithm_adaptive_terminates(sandbox, setting):
+    _, *rest_setting = setting.values()
+
+    random.seed(5)
+    algorithm = GeneticAlgorithm(sandbox.initial_population(100), *rest_setting, control=AdaptiveControl())
+
+    def on_generation(generation: int, _: Population):
+        assert generation < 3000, "adaptive run did not terminate"
+
+    algorithm.solve(on_generation=on_generation, keep_snapshots=False)
+
+    assert algorithm.stop_reason in ("homogeneous", "identical", "stalled")
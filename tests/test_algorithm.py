@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from library.algorithm import GeneticAlgorithm
+from library.codec import BinaryCodec
+from library.fitness import ConstantQuadraticFitnessFunction, QuadraticFitnessFunction
+from library.individual import IndividualFactory, NumericalGenotypeFactory, NumericalPhenotypeFactory
+from library.population import Population
+from library.sandbox import RealGeneticAlgorithmSandbox
+from library.selection import SUS
+
+
+individual_factory = IndividualFactory(genotype_factory=NumericalGenotypeFactory(length=10, codec=BinaryCodec()),
+                                       phenotype_factory=NumericalPhenotypeFactory(codec=BinaryCodec()))
+
+
+@pytest.mark.parametrize("keep_snapshots", [
+    (True),
+    (False)
+])
+def test_GeneticAlgorithm_solve_snapshots(keep_snapshots):
+    population = Population(individual_factory.random(20), individual_factory.optimal(1)[0])
+    algorithm = GeneticAlgorithm(population, SUS(QuadraticFitnessFunction()), None, None)
+    _, populations = algorithm.solve(keep_snapshots=keep_snapshots)
+
+    assert algorithm.stop_reason == "identical"
+    assert len(populations) == (algorithm.generations + 1 if keep_snapshots else 1)
+    assert populations[-1].individuals == algorithm.population.individuals
+
+
+def test_GeneticAlgorithm_patience_stops_flat_fitness():
+    population = Population(individual_factory.random(20), individual_factory.optimal(1)[0])
+    algorithm = GeneticAlgorithm(population, SUS(ConstantQuadraticFitnessFunction()), None, None, patience=10)
+    algorithm.solve(keep_snapshots=False)
+
+    assert algorithm.stop_reason in ("identical", "stalled")
+    assert algorithm.generations <= 11
+
+
+real_sandbox = RealGeneticAlgorithmSandbox()
+
+
+@pytest.mark.parametrize("setting", real_sandbox.settings, ids=real_sandbox._name)
+def test_RealGeneticAlgorithmSandbox_settings_terminate(setting):
+    random.seed(1)
+    algorithm = real_sandbox._algorithm(real_sandbox.initial_population(100), setting, False)
+
+    def on_generation(generation, _):
+        assert generation <= 1000, "run did not stop"
+
+    algorithm.solve(on_generation=on_generation, keep_snapshots=False)
+
+    assert algorithm.stop_reason in ("homogeneous", "identical", "stalled")
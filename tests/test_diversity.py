@@ -0,0 +1,97 @@
+import itertools
+import random
+
+import pytest
+
+from library.bits import hamming, locus_counts, pack, zeros
+from library.diversity import allele_frequencies, distances_to, mean_hamming_distance, metrics
+from library.individual import BinaryGenotypeFactory, BinaryPhenotypeFactory, IndividualFactory
+from library.population import Population
+
+
+individual_factory = IndividualFactory(genotype_factory=BinaryGenotypeFactory(length=8),
+                                       phenotype_factory=BinaryPhenotypeFactory())
+
+
+def individuals_of(chromosomes: list[str]):
+    return [individual_factory.sample(chromosome) for chromosome in chromosomes]
+
+
+@pytest.mark.parametrize("chromosome1,chromosome2,distance", [
+    ("00000000", "00000000", 0),
+    ("00000000", "11111111", 8),
+    ("10101010", "01010101", 8),
+    ("11110000", "11000011", 4)
+])
+def test_hamming(chromosome1, chromosome2, distance):
+    assert hamming(pack(chromosome1), pack(chromosome2)) == distance
+
+
+@pytest.mark.parametrize("chromosome,count", [
+    ("00000000", 8),
+    ("00110100", 5),
+    ("11111111", 0)
+])
+def test_zeros(chromosome, count):
+    assert zeros(pack(chromosome), len(chromosome)) == chromosome.count("0")
+    assert zeros(pack(chromosome), len(chromosome)) == count
+
+
+def test_locus_counts():
+    chromosomes = ["".join(random.choice("01") for _ in range(50)) for _ in range(300)]
+    counts = locus_counts([pack(chromosome) for chromosome in chromosomes], 50)
+    assert counts == [column.count("1") for column in zip(*chromosomes)]
+
+
+def test_mean_hamming_distance_exact():
+    chromosomes = ["00000000", "11111111", "11110000", "00001111"]
+    expected = sum(a != b for x, y in itertools.combinations(chromosomes, 2)
+                   for a, b in zip(x, y)) / 6
+    assert mean_hamming_distance(individuals_of(chromosomes)) == expected
+
+
+def test_mean_hamming_distance_pairwise():
+    chromosomes = ["".join(random.choice("01") for _ in range(8)) for _ in range(60)]
+    expected = sum(hamming(pack(x), pack(y)) for x, y in itertools.combinations(chromosomes, 2)) / (60 * 59 // 2)
+    assert mean_hamming_distance(individuals_of(chromosomes)) == pytest.approx(expected)
+
+
+def test_mean_hamming_distance_sampled():
+    chromosomes = ["00000000", "11111111"] * 200
+    exact = mean_hamming_distance(individuals_of(chromosomes), exact_limit=400)
+    sampled = mean_hamming_distance(individuals_of(chromosomes), exact_limit=100, samples=5000)
+    assert sampled == pytest.approx(exact, abs=0.3)
+
+
+def test_mean_hamming_distance_keeps_global_random_stream():
+    individuals = individuals_of(["00000000", "11111111"] * 200)
+    random.seed(3)
+    expected = random.random()
+    random.seed(3)
+    mean_hamming_distance(individuals, exact_limit=100)
+    assert random.random() == expected
+
+
+
+def test_mean_hamming_distance_sampled_is_reproducible():
+    individuals = individuals_of([format(index % 256, "08b") for index in range(400)])
+    assert (mean_hamming_distance(individuals, exact_limit=100, samples=50)
+            == mean_hamming_distance(individuals, exact_limit=100, samples=50))
+    assert (mean_hamming_distance(individuals, exact_limit=100, samples=50, sampler=random.Random(7))
+            == mean_hamming_distance(individuals, exact_limit=100, samples=50, sampler=random.Random(7)))
+
+def test_allele_frequencies():
+    individuals = individuals_of(["10000000", "11000000", "11100000", "11110000"])
+    assert allele_frequencies(individuals) == [1., 0.75, 0.5, 0.25, 0., 0., 0., 0.]
+
+
+def test_metrics():
+    individuals = individuals_of(["00000000", "00000011", "00000011", "11111111"])
+    optimal = individual_factory.optimal(1)[0]
+    assert distances_to(individuals, optimal) == [0, 2, 2, 8]
+    assert metrics(Population(individuals, optimal)) == {
+        "Unique": 3,
+        "Mean hamming": 24 / 6,
+        "Mean distance to optimum": 3.,
+        "Min distance to optimum": 0
+    }
@@ -0,0 +1,62 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+
+IMPORT_TIME_BUDGET_US = 250_000
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+
+def import_times(module: str):
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               capture_output=True, text=True, check=True, cwd=ROOT)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture
+def broken_matplotlib(tmp_path):
+    # A matplotlib that fails on import, so the engine importing it at all fails loudly
+    package = tmp_path / "matplotlib"
+    package.mkdir()
+    (package / "__init__.py").write_text('raise ImportError("matplotlib should only be imported to plot")\n')
+    return {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), str(ROOT)])}
+
+
+def run_python(code: str, env: dict):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT, env=env)
+
+
+@pytest.mark.parametrize("module", [
+    ("library.algorithm"),
+    ("library.sandbox"),
+    ("library.server"),
+    ("main")
+])
+def test_import_without_plotting(module, broken_matplotlib):
+    completed = run_python(f"import {module}", broken_matplotlib)
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_plotting_imports_matplotlib(broken_matplotlib):
+    completed = run_python("import library.plot; library.plot._pyplot()", broken_matplotlib)
+    assert completed.returncode != 0
+    assert "matplotlib should only be imported to plot" in completed.stderr
+
+
+@pytest.mark.parametrize("module", [
+    ("library.algorithm"),
+    ("library.sandbox")
+])
+def test_import_time_budget(module):
+    times = import_times(module)
+    assert times[module] <= IMPORT_TIME_BUDGET_US
@@ -1,6 +1,6 @@
 import pytest
 
-from library.individual import BinaryGenotypeFactory, NumericalGenotypeFactory
+from library.individual import BinaryGenotypeFactory, IndividualFactory, NumericalGenotypeFactory, RealGenotypeFactory, RealPhenotypeFactory
 
 
 @pytest.mark.parametrize("length,optimal_chromosome", [
@@ -49,3 +49,59 @@ def test_NumericalGenotypeFactory_random(length):
     assert len(genotype_random.chromosome) == length
     assert genotype_random.chromosome.count("0") != 0
     assert genotype_random.chromosome.count("1") != 0
+
+
+@pytest.mark.parametrize("dimensions,upper", [
+    (1, 10.23),
+    (5, 5.12)
+])
+def test_RealGenotypeFactory_optimal(dimensions, upper):
+    genotype_factory = RealGenotypeFactory(dimensions, lower=0., upper=upper)
+    genotype_optimal = genotype_factory.optimal()
+    assert list(genotype_optimal.chromosome) == [upper] * dimensions
+
+
+@pytest.mark.parametrize("dimensions", [
+    (1),
+    (10),
+    (100)
+])
+def test_RealGenotypeFactory_random(dimensions):
+    genotype_factory = RealGenotypeFactory(dimensions, lower=-1., upper=1.)
+    genotype_random = genotype_factory.random()
+    assert len(genotype_random.chromosome) == dimensions
+    assert all(-1. <= gene <= 1. for gene in genotype_random.chromosome)
+
+
+@pytest.mark.parametrize("chromosome,clipped", [
+    ([-3., 0.5, 7.], [-1., 0.5, 1.]),
+    ([0., 0., 0.], [0., 0., 0.])
+])
+def test_RealGenotypeFactory_sample(chromosome, clipped):
+    genotype_factory = RealGenotypeFactory(3, lower=-1., upper=1.)
+    assert list(genotype_factory.sample(chromosome).chromosome) == clipped
+
+
+def test_RealGenotype_key():
+    genotype_factory = RealGenotypeFactory(2, precision=0.01)
+    assert genotype_factory.sample([1.001, 2.]).key == genotype_factory.sample([0.999, 2.001]).key
+    assert genotype_factory.sample([1.02, 2.]).key != genotype_factory.sample([1., 2.]).key
+
+
+def test_RealIndividual_copy():
+    individual_factory = IndividualFactory(genotype_factory=RealGenotypeFactory(2, lower=-10., upper=10.),
+                                           phenotype_factory=RealPhenotypeFactory())
+    individual = individual_factory.sample([1., 2.])
+    individual_copy = individual.copy()
+
+    individual.genotype.mutate(0, 5.)
+
+    assert list(individual.phenotype.value) == [6., 2.]
+    assert list(individual_copy.genotype.chromosome) == [1., 2.]
+    assert individual_copy.phenotype.value is individual_copy.genotype.chromosome
+
+
+def test_RealGenotype_mutate_requires_delta():
+    genotype = RealGenotypeFactory(2).sample([1., 2.])
+    with pytest.raises(TypeError):
+        genotype.mutate(0)
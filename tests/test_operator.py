@@ -0,0 +1,52 @@
+import pytest
+
+from library.individual import IndividualFactory, RealGenotypeFactory, RealPhenotypeFactory
+from library.fitness import QuadraticFitnessFunction
+from library.operator import BlendCrossover, SBXCrossover, GaussianMutation
+
+
+individual_factory = IndividualFactory(genotype_factory=RealGenotypeFactory(dimensions=4, lower=-1., upper=1.),
+                                       phenotype_factory=RealPhenotypeFactory())
+
+
+@pytest.mark.parametrize("crossover", [
+    (BlendCrossover(individual_factory)),
+    (SBXCrossover(individual_factory))
+])
+def test_RealCrossover_next_generation(crossover):
+    prev_individuals = individual_factory.random(20)
+    next_individuals = crossover.next_generation(prev_individuals)
+    assert len(next_individuals) == len(prev_individuals)
+    for individual in next_individuals:
+        assert len(individual.genotype.chromosome) == 4
+        assert all(-1. <= gene <= 1. for gene in individual.genotype.chromosome)
+
+
+@pytest.mark.parametrize("crossover", [
+    (BlendCrossover(individual_factory)),
+    (SBXCrossover(individual_factory))
+])
+def test_RealCrossover_keeps_identical_parents(crossover):
+    parent = individual_factory.sample([0.5, -0.5, 0.25, 0.])
+    next_individuals = crossover.next_generation([parent, parent.copy()])
+    for individual in next_individuals:
+        assert list(individual.genotype.chromosome) == pytest.approx([0.5, -0.5, 0.25, 0.])
+
+
+@pytest.mark.parametrize("rate,changed", [
+    (0., False),
+    (1., True)
+])
+def test_GaussianMutation_next_generation(rate, changed):
+    mutation = GaussianMutation(individual_factory, rate=rate, sigma=0.1)
+    prev_individuals = individual_factory.random(10)
+    next_individuals = mutation.next_generation(prev_individuals)
+    assert len(next_individuals) == len(prev_individuals)
+    assert any(prev_individual.genotype.chromosome != next_individual.genotype.chromosome
+               for prev_individual, next_individual in zip(prev_individuals, next_individuals)) == changed
+
+
+def test_QuadraticFitnessFunction_real_phenotype():
+    individual = individual_factory.sample([1., -0.5, 0., 0.5])
+    assert individual.phenotype.value is individual.genotype.chromosome
+    assert QuadraticFitnessFunction().score(individual) == pytest.approx(1.5)
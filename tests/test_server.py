@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import pytest
+
+from library.server import ExperimentServer
+
+
+async def exchange(requests: list[dict], until: str, cancel_after: str | None = None, finished: list | None = None):
+    server = ExperimentServer(workers=1, queue_size=2)
+    socket = await server.start(port=0)
+    port = socket.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for request in requests:
+            writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+        events = []
+        while not events or events[-1]["event"] != until:
+            events.append(json.loads(await asyncio.wait_for(reader.readline(), 30)))
+            if events[-1]["event"] == cancel_after:
+                writer.write((json.dumps({"op": "cancel", "job": events[-1]["job"]}) + "\n").encode())
+                await writer.drain()
+                cancel_after = None
+        if finished is not None:
+            finished.append((dict(server.jobs), server.status()))
+        return events
+    finally:
+        writer.close()
+        await server.close()
+
+
+def test_ExperimentServer_streams_generations():
+    job = {"sandbox": "numerical", "fitness": "QuadraticFitnessFunction", "selection": "SUS",
+           "crossover": None, "mutation": None, "size": 20, "runs": 2}
+    finished = []
+    events = asyncio.run(exchange([{"op": "submit", "job": job}], until="done", finished=finished))
+    kinds = [event["event"] for event in events]
+    assert kinds[:2] == ["queued", "running"]
+    assert "generation" in kinds
+    assert all("hamming" in event for event in events if event["event"] == "generation")
+    assert [event["run"] for event in events if event["event"] == "run"] == [1, 2]
+    jobs, status = finished[0]
+    assert jobs == {}
+    assert status["finished"] == {1: "done"}
+
+
+def test_ExperimentServer_cancels_running_job():
+    job = {"sandbox": "binary", "fitness": "Constant100FitnessFunction", "selection": "RWS",
+           "crossover": "OnePointCrossover", "mutation": "DenseMutation", "size": 100, "runs": 1}
+    events = asyncio.run(exchange([{"op": "submit", "job": job}], until="cancelled", cancel_after="generation"))
+    assert events[-1]["event"] == "cancelled"
+
+
+@pytest.mark.parametrize("job,error", [
+    ({"sandbox": "unknown"}, "sandbox"),
+    ({"sandbox": "binary", "size": 1}, "size"),
+    ({"sandbox": "binary", "fitness": "QuadraticFitnessFunction", "selection": "SUS"}, "setting"),
+    ({"sandbox": "numerical", "fitness": "QuadraticFitnessFunction", "selection": "SUS",
+      "crossover": "OnePointCrossover", "mutation": None, "size": 21}, "even"),
+    ({"sandbox": "numerical", "fitness": "QuadraticFitnessFunction", "selection": "SUS",
+      "crossover": None, "mutation": "DenseMutation", "size": 50}, "mutation table")
+])
+def test_ExperimentServer_rejects_invalid_job(job, error):
+    events = asyncio.run(exchange([{"op": "submit", "job": job}], until="error"))
+    assert error in events[-1]["error"]
+
+
+def test_ExperimentServer_rejects_when_queue_is_full():
+    job = {"sandbox": "binary", "fitness": "Constant100FitnessFunction", "selection": "RWS",
+           "crossover": "OnePointCrossover", "mutation": "DenseMutation", "size": 100, "runs": 1}
+    events = asyncio.run(exchange([{"op": "submit", "job": job}] * 5, until="error"))
+    assert "queue is full" in events[-1]["error"]
+
+
+def test_ExperimentServer_runs_jobs_in_parallel_workers():
+    job = {"sandbox": "binary", "fitness": "Constant100FitnessFunction", "selection": "RWS",
+           "crossover": "OnePointCrossover", "mutation": "DenseMutation", "size": 100, "runs": 1}
+
+    async def exchange_parallel():
+        server = ExperimentServer(workers=2, queue_size=2)
+        socket = await server.start(port=0)
+        port = socket.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            for _ in range(2):
+                writer.write((json.dumps({"op": "submit", "job": job}) + "\n").encode())
+            await writer.drain()
+            # Neither job finishes on its own soon, so generations of both only arrive if they run side by side
+            generating, cancelled = set(), set()
+            while len(cancelled) < 2:
+                event = json.loads(await asyncio.wait_for(reader.readline(), 30))
+                if event["event"] == "generation" and event["job"] not in generating:
+                    generating.add(event["job"])
+                    if len(generating) == 2:
+                        for job_id in generating:
+                            writer.write((json.dumps({"op": "cancel", "job": job_id}) + "\n").encode())
+                        await writer.drain()
+                elif event["event"] == "cancelled":
+                    cancelled.add(event["job"])
+            return generating, cancelled
+        finally:
+            writer.close()
+            await server.close()
+
+    generating, cancelled = asyncio.run(exchange_parallel())
+    assert generating == cancelled == {1, 2}
@@ -0,0 +1,197 @@
+import random
+import sqlite3
+
+import pytest
+
+from library.algorithm import GeneticAlgorithm
+from library.codec import BinaryCodec
+from library.fitness import QuadraticFitnessFunction
+from library.individual import IndividualFactory, NumericalGenotypeFactory, NumericalPhenotypeFactory
+from library.operator import DenseMutation
+from library.sandbox import GeneticAlgorithmSandbox
+from library.store import MEAN_GENERATIONS, SUCCESS_RATE, ResultStore
+
+
+def result(setting: str, solved: bool, generations: int, size: int = 100,
+           sandbox: str = "TestSandbox", adaptive: bool = False):
+    return {
+        "sandbox": sandbox, "setting": setting, "fitness": "QuadraticFitnessFunction",
+        "selection": "SUS", "crossover": None, "mutation": None, "adaptive": int(adaptive), "size": size,
+        "run": 1, "population_seed": 1, "seed": 2, "generations": generations,
+        "stop_reason": "identical", "solved": int(solved), "elapsed": 0.01,
+        "mean_health": 1., "max_health": 1., "min_health": 1., "stdev_health": 0.
+    }
+
+
+def test_ResultStore_batches_writes(tmp_path):
+    path = str(tmp_path / "results.db")
+
+    def rows_on_disk():
+        with sqlite3.connect(path) as connection:
+            return connection.execute("SELECT COUNT(*) FROM experiments").fetchone()[0]
+
+    store = ResultStore(path, batch_size=10)
+    for _ in range(25):
+        store.record(result("<A>", True, 10))
+    assert rows_on_disk() == 20
+    assert store.count() == 25
+    assert rows_on_disk() == 25
+    store.close()
+
+
+def test_ResultStore_rejects_incomplete_result():
+    store = ResultStore()
+    with pytest.raises(ValueError):
+        store.record({"setting": "<A>"})
+
+
+def test_ResultStore_aggregates():
+    with ResultStore() as store:
+        for index in range(1000):
+            store.record(result("<A>", index % 4 == 0, 10 if index % 4 == 0 else 50))
+            store.record(result("<B>", True, 20 + index % 2, size=200))
+
+        assert store.success_rate() == {("TestSandbox", "<A>", False, 100): 0.25,
+                                        ("TestSandbox", "<B>", False, 200): 1.}
+        assert store.success_rate(size=200) == {("TestSandbox", "<B>", False, 200): 1.}
+        assert store.mean_generations() == {("TestSandbox", "<A>", False, 100): 10.,
+                                            ("TestSandbox", "<B>", False, 200): 20.5}
+        assert store.mean_generations(solved_only=False)[("TestSandbox", "<A>", False, 100)] == 40.
+
+
+def test_ResultStore_aggregates_separate_sandboxes_and_adaptive():
+    with ResultStore() as store:
+        store.record(result("<A>", True, 10))
+        store.record(result("<A>", False, 30, adaptive=True))
+        store.record(result("<A>", False, 50, sandbox="OtherSandbox"))
+
+        assert store.success_rate() == {("TestSandbox", "<A>", False, 100): 1.,
+                                        ("TestSandbox", "<A>", True, 100): 0.,
+                                        ("OtherSandbox", "<A>", False, 100): 0.}
+        assert store.mean_generations(solved_only=False) == {("TestSandbox", "<A>", False, 100): 10.,
+                                                             ("TestSandbox", "<A>", True, 100): 30.,
+                                                             ("OtherSandbox", "<A>", False, 100): 50.}
+
+
+@pytest.mark.parametrize("query,parameters", [
+    (SUCCESS_RATE, {"size": None}),
+    (MEAN_GENERATIONS, {"size": 100, "solved_only": 1})
+])
+def test_ResultStore_aggregates_use_index(query, parameters):
+    store = ResultStore()
+    plan = store.connection.execute(f"EXPLAIN QUERY PLAN {query}", parameters).fetchall()
+    assert any("COVERING INDEX experiments_summary" in step[-1] for step in plan)
+    assert not any("TEMP B-TREE" in step[-1] for step in plan)
+
+
+def test_GeneticAlgorithmSandbox_report_records_runs(tmp_path):
+    individual_factory = IndividualFactory(genotype_factory=NumericalGenotypeFactory(length=10, codec=BinaryCodec()),
+                                           phenotype_factory=NumericalPhenotypeFactory(codec=BinaryCodec()))
+    sandbox = GeneticAlgorithmSandbox(individual_factory,
+                                      fitness_functions=[QuadraticFitnessFunction()],
+                                      crossovers=[None],
+                                      mutations=[None])
+
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        sandbox.report(size=20, runs=3, snapshot_first=0, store=store, seed=7)
+        rows = store.connection.execute(
+            "SELECT run, seed, generations, stop_reason FROM experiments ORDER BY id").fetchall()
+
+    assert len(rows) == 6
+    assert all(stop_reason == "identical" and generations > 0 for _, _, generations, stop_reason in rows)
+
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        assert store.count() == 6
+        sandbox.report(size=20, runs=3, snapshot_first=0, store=store, seed=7)
+        replayed = store.connection.execute(
+            "SELECT run, seed, generations, stop_reason FROM experiments ORDER BY id").fetchall()[6:]
+
+    assert replayed == rows
+
+
+
+def test_GeneticAlgorithmSandbox_report_keeps_snapshots_of_plotted_runs_only(monkeypatch):
+    individual_factory = IndividualFactory(genotype_factory=NumericalGenotypeFactory(length=10, codec=BinaryCodec()),
+                                           phenotype_factory=NumericalPhenotypeFactory(codec=BinaryCodec()))
+    sandbox = GeneticAlgorithmSandbox(individual_factory,
+                                      fitness_functions=[QuadraticFitnessFunction()],
+                                      crossovers=[None],
+                                      mutations=[None])
+    snapshots = []
+    monkeypatch.setattr(sandbox, "plot_snapshot",
+                        lambda run, populations, *_: snapshots.append((run, len(populations))))
+    solve = GeneticAlgorithm.solve
+    kept = []
+
+    def spy(self, *args, keep_snapshots=True, **kwargs):
+        kept.append(keep_snapshots)
+        return solve(self, *args, keep_snapshots=keep_snapshots, **kwargs)
+
+    monkeypatch.setattr(GeneticAlgorithm, "solve", spy)
+    sandbox.report(size=20, runs=3, snapshot_first=1)
+
+    settings = len(sandbox.settings)
+    assert kept == [True] * settings + [False] * 2 * settings
+    assert [run for run, _ in snapshots] == [1] * settings
+    assert all(count > 1 for _, count in snapshots)
+
+def test_GeneticAlgorithmSandbox_replays_recorded_run():
+    individual_factory = IndividualFactory(genotype_factory=NumericalGenotypeFactory(length=10, codec=BinaryCodec()),
+                                           phenotype_factory=NumericalPhenotypeFactory(codec=BinaryCodec()))
+    # DenseMutation changes genotypes in place, so it must not leak into the settings run after it
+    sandbox = GeneticAlgorithmSandbox(individual_factory,
+                                      fitness_functions=[QuadraticFitnessFunction()],
+                                      crossovers=[None],
+                                      mutations=[DenseMutation(), None])
+
+    with ResultStore() as store:
+        sandbox.report(size=100, runs=2, snapshot_first=0, store=store, seed=11)
+        rows = store.connection.execute(
+            "SELECT setting, size, population_seed, seed, generations, stop_reason, solved, mean_health "
+            "FROM experiments WHERE mutation IS NULL AND run = 2").fetchall()
+
+    assert len(rows) == 2
+    for setting, size, population_seed, seed, generations, stop_reason, solved, mean_health in rows:
+        algorithm = sandbox.replay(setting, size, population_seed, seed)
+        assert algorithm.generations == generations
+        assert algorithm.stop_reason == stop_reason
+        assert int(algorithm._check_for_solution()) == solved
+        individuals_health = [QuadraticFitnessFunction().score(individual)
+                              for individual in algorithm.population.individuals]
+        assert sum(individuals_health) / len(individuals_health) == pytest.approx(mean_health)
+
+
+def test_GeneticAlgorithmSandbox_report_without_seed_keeps_random_stream():
+    individual_factory = IndividualFactory(genotype_factory=NumericalGenotypeFactory(length=10, codec=BinaryCodec()),
+                                           phenotype_factory=NumericalPhenotypeFactory(codec=BinaryCodec()))
+    sandbox = GeneticAlgorithmSandbox(individual_factory,
+                                      fitness_functions=[QuadraticFitnessFunction()],
+                                      crossovers=[None],
+                                      mutations=[None])
+
+    with ResultStore() as store:
+        random.seed(5)
+        sandbox.report(size=20, runs=1, snapshot_first=0, store=store)
+        first = store.connection.execute("SELECT generations, population_seed, seed FROM experiments").fetchall()
+        random.seed(5)
+        sandbox.report(size=20, runs=1, snapshot_first=0, store=store)
+        second = store.connection.execute("SELECT generations, population_seed, seed FROM experiments").fetchall()[2:]
+
+    assert first == second
+    assert all(population_seed is None and seed is None for _, population_seed, seed in first)
+
+
+def test_GeneticAlgorithmSandbox_settings_do_not_share_individuals():
+    individual_factory = IndividualFactory(genotype_factory=NumericalGenotypeFactory(length=10, codec=BinaryCodec()),
+                                           phenotype_factory=NumericalPhenotypeFactory(codec=BinaryCodec()))
+    sandbox = GeneticAlgorithmSandbox(individual_factory,
+                                      fitness_functions=[QuadraticFitnessFunction()],
+                                      crossovers=[None],
+                                      mutations=[DenseMutation(rate=0.01)])
+
+    random.seed(1)
+    initial_population = sandbox.initial_population(100)
+    chromosomes = [individual.genotype.chromosome for individual in initial_population.individuals]
+    sandbox._algorithm(initial_population, sandbox.settings[0], adaptive=False).solve()
+
+    assert [individual.genotype.chromosome for individual in initial_population.individuals] == chromosomes